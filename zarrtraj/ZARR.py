@@ -135,12 +135,14 @@ from MDAnalysis.coordinates import base, core
 from MDAnalysis.exceptions import NoDataError
 from MDAnalysis.due import due, Doi
 from MDAnalysis.lib.util import store_init_arguments
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from .utils import *
 from .cache import FrameCache
 import collections
 import numbers
 import logging
+import os
 import warnings
 
 
@@ -267,6 +269,11 @@ class ZARRH5MDReader(base.ReaderBase):
         group : str (optional)
             group in 'particles' to read from. Not required if only one group
             is present in 'particles'
+        cache_size : int (optional)
+            total cache memory budget in bytes [100 MB]. For local files the
+            whole budget holds decompressed chunk slabs; for remote files it
+            is split evenly between a store-level cache of compressed chunks
+            and the decompressed slab cache
         **kwargs : dict
             General reader arguments.
 
@@ -367,6 +374,19 @@ class ZARRH5MDReader(base.ReaderBase):
                 "or force group in the h5md file."
             )
 
+        # Zarrtraj doesn't support variable topologies, so the atom
+        # count can be validated once here rather than per-frame
+        for name in ("position", "velocity", "force"):
+            if name in self._elements:
+                n_atoms_elem = self._elements[name].value.shape[1]
+                if n_atoms_elem != self.n_atoms:
+                    raise ValueError(
+                        "Datasets in the particles group have "
+                        f"inconsistent numbers of atoms: '{name}' has "
+                        f"{n_atoms_elem} atoms but {self.n_atoms} "
+                        "were expected"
+                    )
+
         self.ts = self._Timestep(
             self.n_atoms,
             positions=("position" in self._elements),
@@ -389,9 +409,16 @@ class ZARRH5MDReader(base.ReaderBase):
         self._set_translated_units()  # fills units dictionary
         self._check_units()  # raises error if units missing
 
+        # for ZarrLRUCache, the other half of the budget went to the
+        # store-level cache in _open_trajectory
+        slab_budget = (
+            self._cache_size // 2
+            if self._cache_type is ZarrLRUCache
+            else self._cache_size
+        )
         self._cache = self._cache_type(
             self._file,
-            self._cache_size,
+            slab_budget,
             self.ts,
             self.chunks[0],
             self._elements,
@@ -533,8 +560,11 @@ class ZARRH5MDReader(base.ReaderBase):
         # special case: using builtin LRU cache
         # normally the cache object handles cache construction
         if self._cache_type == ZarrLRUCache:
+            # cache_size funds both layers for this cache type:
+            # compressed chunks in the store cache and decompressed
+            # slabs in the frame cache, half each
             cache = zarr.storage.LRUStoreCache(
-                self._mapping, max_size=self._cache_size
+                self._mapping, max_size=self._cache_size // 2
             )
             self._file = zarr.open_group(store=cache, mode="r")
         else:
@@ -553,7 +583,10 @@ class ZARRH5MDReader(base.ReaderBase):
                     "contain exactly one group in 'particles'"
                 )
 
-        particle_group = self._file["particles"][self._group]
+        # keep the handle so later accesses don't walk the store again
+        self._particle_group = particle_group = self._file["particles"][
+            self._group
+        ]
         self._elements = dict()
 
         if "observables" in self._file:
@@ -629,7 +662,7 @@ class ZARRH5MDReader(base.ReaderBase):
 
     def _read_frame(self, frame):
         """reads data from h5md-formatted file and copies to current timestep"""
-        if frame < 0 or frame >= self.n_frames:
+        if not 0 <= frame < self._n_frames:
             raise IOError("Frame index out of range")
 
         self._frame = self._cache.load_frame(frame)
@@ -1509,6 +1542,38 @@ class ZarrNoCache(FrameCache):
     """No caching for Zarr-interfaced reads
     Used for reading H5MD formatted files from disk"""
 
+    __slots__ = (
+        "_elements",
+        "_global_steparray",
+        "_stepmaps",
+        "_chunk_cache",
+        "_chunk_cache_nbytes",
+        "_dim_buf",
+        "_observables",
+        "_tail_selections",
+        "_io_pool",
+        "_edges_orthorhombic",
+        "_populated_chunks",
+        "_has_edges",
+        "_has_positions",
+        "_has_velocities",
+        "_has_forces",
+        "_edges_element",
+        "_edges_stepmap",
+        "_pos_element",
+        "_pos_stepmap",
+        "_vel_element",
+        "_vel_stepmap",
+        "_force_element",
+        "_force_stepmap",
+    )
+
+    #: elements handled explicitly in _load_timestep_frame rather than
+    #: as observables
+    _particle_group_elems = frozenset(
+        ("position", "velocity", "force", "box/edges")
+    )
+
     def __init__(
         self,
         open_file,
@@ -1523,6 +1588,25 @@ class ZarrNoCache(FrameCache):
         self._elements = elements
         self._global_steparray = global_steparray
         self._stepmaps = stepmaps
+        self._bind_elements()
+        # Slabs of decompressed chunk data keyed by (dataset name, chunk
+        # index), evicted least-recently-used once their total size
+        # exceeds the cache size
+        self._chunk_cache = collections.OrderedDict()
+        self._chunk_cache_nbytes = 0
+        # Selection tails (everything after the frame axis) per dataset,
+        # built once so slab reads don't reconstruct them per miss
+        self._tail_selections = {}
+        # Created lazily; executors cannot be pickled
+        self._io_pool = None
+        # Chunk indices along the frame axis that actually exist in the
+        # store, per dataset; None means listing failed and every chunk
+        # must be read. Built lazily on first slab miss.
+        self._populated_chunks = {}
+        # Reusable output buffer for orthorhombic dimensions; the
+        # Timestep.dimensions setter copies the values out
+        self._dim_buf = np.empty(6, dtype=np.float32)
+        self._dim_buf[3:] = 90
 
     def update_desired_dsets(
         self,
@@ -1533,6 +1617,175 @@ class ZarrNoCache(FrameCache):
         self._elements = elements
         self._global_steparray = global_steparray
         self._stepmaps = stepmaps
+        self._bind_elements()
+        self._chunk_cache.clear()
+        self._chunk_cache_nbytes = 0
+        self._tail_selections.clear()
+        self._populated_chunks.clear()
+
+    def _bind_elements(self):
+        """Precompute per-element flags and handles from the current
+        element mapping so the per-frame path does no dict scanning"""
+        elements = self._elements
+        stepmaps = self._stepmaps
+        self._observables = tuple(
+            (elem, h5mdelement)
+            for elem, h5mdelement in elements.items()
+            if elem not in self._particle_group_elems
+        )
+        self._has_edges = "box/edges" in elements
+        self._has_positions = "position" in elements
+        self._has_velocities = "velocity" in elements
+        self._has_forces = "force" in elements
+        self._edges_element = elements.get("box/edges")
+        self._edges_stepmap = stepmaps.get("box/edges")
+        self._pos_element = elements.get("position")
+        self._pos_stepmap = stepmaps.get("position")
+        self._vel_element = elements.get("velocity")
+        self._vel_stepmap = stepmaps.get("velocity")
+        self._force_element = elements.get("force")
+        self._force_stepmap = stepmaps.get("force")
+        # (n_frames, 3) edges are orthorhombic boxes, (n_frames, 3, 3)
+        # are triclinic; the rank is fixed so decide once here
+        self._edges_orthorhombic = (
+            self._has_edges and self._edges_element.value.ndim == 2
+        )
+
+    def _get_frame_data(self, name, dset, index):
+        """Return frame ``index`` of ``dset``, reading the full chunk-sized
+        slab containing it into the cache on first touch so that subsequent
+        frames from the same chunk are served from memory rather than
+        triggering another store read and decompression.
+        """
+        if isinstance(dset, np.ndarray):
+            # fixed-step elements expose step/time as in-memory arrays
+            return dset[index]
+
+        chunk_size = dset.chunks[0]
+        chunk_index = index // chunk_size
+        key = (name, chunk_index)
+        try:
+            slab = self._chunk_cache[key]
+            self._chunk_cache.move_to_end(key)
+        except KeyError:
+            slab = self._read_slab(name, dset, chunk_index)
+            self._store_slab(key, slab)
+        return slab[index - chunk_index * chunk_size]
+
+    def _read_slab(self, name, dset, chunk_index):
+        """Read the chunk-sized slab at ``chunk_index`` of ``dset``"""
+        chunk_size = dset.chunks[0]
+        chunk_start = chunk_index * chunk_size
+        if dset.fill_value is not None:
+            populated = self._populated_chunk_ids(name, dset)
+            if populated is not None and chunk_index not in populated:
+                # chunk was never written; synthesize it without
+                # touching the store
+                length = min(chunk_size, dset.shape[0] - chunk_start)
+                return np.full(
+                    (length,) + dset.shape[1:],
+                    dset.fill_value,
+                    dtype=dset.dtype,
+                )
+        self._advise_next_chunk(dset, chunk_index)
+        tail = self._tail_selections.get(name)
+        if tail is None:
+            tail = (slice(None),) * (dset.ndim - 1)
+            self._tail_selections[name] = tail
+        return dset.get_orthogonal_selection(
+            (slice(chunk_start, chunk_start + chunk_size),) + tail
+        )
+
+    def _populated_chunk_ids(self, name, dset):
+        """Chunk indices along the frame axis of ``dset`` that exist in
+        the store, listed once per dataset; ``None`` if the store could
+        not be listed"""
+        try:
+            return self._populated_chunks[name]
+        except KeyError:
+            pass
+        try:
+            listing = zarr.storage.listdir(dset.store, dset.path)
+        except Exception:
+            ids = None
+        else:
+            ids = set()
+            for key in listing:
+                first = key.split("/")[0].split(".")[0]
+                if first.isdigit():
+                    ids.add(int(first))
+        self._populated_chunks[name] = ids
+        return ids
+
+    def _store_slab(self, key, slab):
+        """Insert a slab into the cache, evicting least-recently-used
+        slabs once the byte budget is exceeded"""
+        self._chunk_cache[key] = slab
+        self._chunk_cache_nbytes += slab.nbytes
+        while (
+            self._chunk_cache_nbytes > self._cache_size
+            and len(self._chunk_cache) > 1
+        ):
+            _, evicted = self._chunk_cache.popitem(last=False)
+            self._chunk_cache_nbytes -= evicted.nbytes
+
+    def _prefetch_step_slabs(self, step):
+        """Fetch this step's missing core-dataset slabs concurrently.
+
+        Decompression in numcodecs releases the GIL, so reads for
+        independent datasets genuinely overlap.
+        """
+        requests = []
+        for elem in ("position", "velocity", "force", "box/edges"):
+            h5mdelement = self._elements.get(elem)
+            if h5mdelement is None:
+                continue
+            index = self._stepmaps[elem].get(step)
+            if index is None:
+                continue
+            dset = h5mdelement.value
+            name = f"{elem}/value"
+            key = (name, index // dset.chunks[0])
+            if key not in self._chunk_cache:
+                requests.append((key, name, dset))
+        if len(requests) < 2:
+            # nothing to overlap; let _get_frame_data read serially
+            return
+        if self._io_pool is None:
+            # one worker per core dataset
+            self._io_pool = ThreadPoolExecutor(max_workers=4)
+        slabs = self._io_pool.map(
+            lambda req: self._read_slab(req[1], req[2], req[0][1]),
+            requests,
+        )
+        for (key, _, _), slab in zip(requests, slabs):
+            self._store_slab(key, slab)
+
+    @staticmethod
+    def _advise_next_chunk(dset, chunk_index):
+        """Hint the OS to start reading the file holding the chunk after
+        ``chunk_index`` so sequential playback overlaps disk reads with
+        decoding. No-op for non-directory stores and on platforms
+        without ``posix_fadvise``.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        store = dset.store
+        if not isinstance(store, zarr.storage.DirectoryStore):
+            return
+        coords = (chunk_index + 1,) + (0,) * (dset.ndim - 1)
+        if coords[0] * dset.chunks[0] >= dset.shape[0]:
+            return
+        key = dset._chunk_key(coords)
+        path = os.path.join(store.path, *key.split("/"))
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
 
     def load_frame(self, frame):
         """Reader responsible for raising StopIteration when no more frames"""
@@ -1544,86 +1797,152 @@ class ZarrNoCache(FrameCache):
         # reader must ensure time value present (not -1)
         step = self._global_steparray[frame]
 
-        self._timestep.frame = frame
-        self._timestep.data["step"] = step
+        # bind hot attributes to locals; this method runs once per frame
+        ts = self._timestep
+
+        ts.frame = frame
+        ts.data["step"] = step
 
         # Assume all time values from the same integration step
         # are exactly the same
         curr_time = None
 
-        if "box/edges" in self._elements:
-            if step in self._stepmaps["box/edges"]:
-                edges_index = self._stepmaps["box/edges"][step]
-                edges = self._elements["box/edges"].value[edges_index]
-                if edges.shape == (3,):
-                    self._timestep.dimensions = [*edges, 90, 90, 90]
+        self._prefetch_step_slabs(step)
+
+        if self._has_edges:
+            edges_index = self._edges_stepmap.get(step)
+            if edges_index is not None:
+                edges = self._get_frame_data(
+                    "box/edges/value",
+                    self._edges_element.value,
+                    edges_index,
+                )
+                if self._edges_orthorhombic:
+                    self._dim_buf[:3] = edges
+                    ts.dimensions = self._dim_buf
                 else:
-                    self._timestep.dimensions = core.triclinic_box(*edges)
-                if curr_time is None and self._elements["box/edges"].has_time:
-                    curr_time = self._elements["box/edges"].time[edges_index]
+                    ts.dimensions = core.triclinic_box(*edges)
+                if curr_time is None and self._edges_element.has_time:
+                    curr_time = self._get_frame_data(
+                        "box/edges/time",
+                        self._edges_element.time,
+                        edges_index,
+                    )
             else:
-                self._timestep.dimensions = None
-
-        if "position" in self._elements:
-            if step in self._stepmaps["position"]:
-                self._timestep.has_positions = True
-                pos_index = self._stepmaps["position"][step]
-                self._timestep.positions = self._elements["position"].value[
-                    pos_index
-                ]
-                if curr_time is None and self._elements["position"].has_time:
-                    curr_time = self._elements["position"].time[pos_index]
+                ts.dimensions = None
+
+        if self._has_positions:
+            pos_index = self._pos_stepmap.get(step)
+            if pos_index is not None:
+                ts.has_positions = True
+                np.copyto(
+                    ts.positions,
+                    self._get_frame_data(
+                        "position/value",
+                        self._pos_element.value,
+                        pos_index,
+                    ),
+                )
+                if curr_time is None and self._pos_element.has_time:
+                    curr_time = self._get_frame_data(
+                        "position/time",
+                        self._pos_element.time,
+                        pos_index,
+                    )
             else:
-                self._timestep.has_positions = False
-
-        if "velocity" in self._elements:
-            if step in self._stepmaps["velocity"]:
-                self._timestep.has_velocities = True
-                vel_index = self._stepmaps["velocity"][step]
-                self._timestep.velocities = self._elements["velocity"].value[
-                    vel_index
-                ]
-                if curr_time is None and self._elements["velocity"].has_time:
-                    curr_time = self._elements["velocity"].time[vel_index]
+                ts.has_positions = False
+
+        if self._has_velocities:
+            vel_index = self._vel_stepmap.get(step)
+            if vel_index is not None:
+                ts.has_velocities = True
+                np.copyto(
+                    ts.velocities,
+                    self._get_frame_data(
+                        "velocity/value",
+                        self._vel_element.value,
+                        vel_index,
+                    ),
+                )
+                if curr_time is None and self._vel_element.has_time:
+                    curr_time = self._get_frame_data(
+                        "velocity/time",
+                        self._vel_element.time,
+                        vel_index,
+                    )
             else:
-                self._timestep.has_velocities = False
-
-        if "force" in self._elements:
-            if step in self._stepmaps["force"]:
-                self._timestep.has_forces = True
-                force_index = self._stepmaps["force"][step]
-                self._timestep.forces = self._elements["force"].value[
-                    force_index
-                ]
-                if curr_time is None and self._elements["force"].has_time:
-                    curr_time = self._elements["force"].time[force_index]
+                ts.has_velocities = False
+
+        if self._has_forces:
+            force_index = self._force_stepmap.get(step)
+            if force_index is not None:
+                ts.has_forces = True
+                np.copyto(
+                    ts.forces,
+                    self._get_frame_data(
+                        "force/value",
+                        self._force_element.value,
+                        force_index,
+                    ),
+                )
+                if curr_time is None and self._force_element.has_time:
+                    curr_time = self._get_frame_data(
+                        "force/time",
+                        self._force_element.time,
+                        force_index,
+                    )
             else:
-                self._timestep.has_forces = False
-
-        exclude = {"position", "velocity", "force", "box/edges"}
-
-        for elem, h5mdelement in self._elements.items():
-            if elem not in exclude:
-                if not h5mdelement.is_time_independent():
-                    if step in self._stepmaps[elem]:
-                        obsv_index = self._stepmaps[elem][step]
-                        self._timestep.data[elem] = h5mdelement.value[
-                            obsv_index
-                        ]
-                        if curr_time is None and self._elements[elem].has_time:
-                            curr_time = self._elements[elem].time[obsv_index]
-                    elif elem in self._timestep.data:
-                        self._timestep.data[elem] = None
-                else:
-                    # must be time independent
-                    self._timestep.data[elem] = h5mdelement.value[:]
+                ts.has_forces = False
+
+        for elem, h5mdelement in self._observables:
+            if not h5mdelement.is_time_independent():
+                obsv_index = self._stepmaps[elem].get(step)
+                if obsv_index is not None:
+                    data = self._get_frame_data(
+                        f"{elem}/value", h5mdelement.value, obsv_index
+                    )
+                    if isinstance(data, np.ndarray):
+                        # hand out a copy; a view would alias the
+                        # shared slab cache
+                        data = data.copy()
+                    ts.data[elem] = data
+                    if curr_time is None and h5mdelement.has_time:
+                        curr_time = self._get_frame_data(
+                            f"{elem}/time",
+                            h5mdelement.time,
+                            obsv_index,
+                        )
+                elif elem in ts.data:
+                    ts.data[elem] = None
+            else:
+                # must be time independent
+                ts.data[elem] = h5mdelement.value[:]
+
+        ts.time = curr_time
 
-        self._timestep.time = curr_time
+    def __getstate__(self):
+        state = {
+            slot: getattr(self, slot)
+            for klass in type(self).__mro__
+            for slot in getattr(klass, "__slots__", ())
+            if hasattr(self, slot)
+        }
+        # executors cannot be pickled; recreated lazily on first use
+        state["_io_pool"] = None
+        return state
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
 
     def cleanup(self):
-        pass
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False)
+            self._io_pool = None
 
 
 class ZarrLRUCache(ZarrNoCache):
     """Clone of ZarrNoCache to allow differentiation since
     ZarrLRUCache is a special case where the reader handles the cache"""
+
+    __slots__ = ()
@@ -1,10 +1,21 @@
 import abc
 import threading
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 
 class FrameCache(abc.ABC):
 
+    __slots__ = (
+        "_file",
+        "_cache_size",
+        "_timestep",
+        "_frames_per_chunk",
+        "_frame_seq",
+    )
+
     def __init__(
         self, open_file, cache_size, timestep, frames_per_chunk, *args, **kwargs
     ):
@@ -43,46 +54,199 @@ class FrameCache(abc.ABC):
         """Call this in the reader's close() method"""
 
 
-# Not yet implemented
 class AsyncFrameCache(FrameCache, threading.Thread):
+    """Cache that prefetches upcoming chunks on a background thread
+    so that store reads and decompression overlap with analysis.
+
+    Subclasses provide the storage-specific hooks
+    (:meth:`_cache_contains`, :meth:`_cached_keys`, :meth:`_get_key`,
+    :meth:`_evict`, :meth:`_load_timestep`).
+    """
 
-    def __init__(self):
-        super(FrameCache, self).__init__()
-        self._frame_seq = deque([])
+    # threading.Thread still provides a __dict__ for its own state, but
+    # the cache attributes get fixed slot offsets
+    __slots__ = (
+        "_reader_q",
+        "_stop_event",
+        "_first_read",
+        "_mutex",
+        "_progress",
+        "_chunk_ready",
+        "_max_workers",
+        "_consumer_pos",
+        "_chunk_to_positions",
+    )
+
+    def __init__(
+        self,
+        open_file,
+        cache_size,
+        timestep,
+        frames_per_chunk,
+        max_workers=4,
+        *args,
+        **kwargs,
+    ):
+        FrameCache.__init__(
+            self, open_file, cache_size, timestep, frames_per_chunk
+        )
+        threading.Thread.__init__(self, daemon=True)
+        self._frame_seq = np.empty(0, dtype=np.int64)
+        self._reader_q = deque()
         self._stop_event = threading.Event()
         self._first_read = True
         self._mutex = threading.Lock()
-        self._frame_available = threading.Condition(self._mutex)
+        # wakes the prefetch loop when the consumer advances or a
+        # fetch completes
+        self._progress = threading.Condition(self._mutex)
+        # per-chunk readiness signals so a finished fetch wakes only
+        # the consumers waiting on that chunk
+        self._chunk_ready = {}
+        self._max_workers = max_workers
+        self._consumer_pos = 0
+        self._chunk_to_positions = {}
 
-    def load_first_frame(self):
-        pass
+    def update_frame_seq(self, frame_seq):
+        # keep the sequence as an array and advance an integer cursor
+        # rather than popping elements, so consuming a frame moves no
+        # memory
+        super().update_frame_seq(np.asarray(frame_seq, dtype=np.int64))
+        # positions in the frame sequence at which each chunk is
+        # referenced, sorted, so _predict can binary-search next uses
+        self._consumer_pos = 0
+        self._chunk_to_positions = {}
+        for i, frame in enumerate(self._frame_seq):
+            key = int(frame) // self._frames_per_chunk
+            self._chunk_to_positions.setdefault(key, []).append(i)
+        for key, positions in self._chunk_to_positions.items():
+            self._chunk_to_positions[key] = np.asarray(
+                positions, dtype=np.int64
+            )
 
     def load_frame(self):
         if self._first_read:
             self._first_read = False
             self.start()
         frame = self._reader_q.popleft()
-        with self._frame_available:
-            while not self._cache_contains(frame):
-                self._frame_available.wait()
-
-            self._load_timestep(frame)
+        key = frame // self._frames_per_chunk
+        # residency and the readiness Event are checked under one lock,
+        # and residency is re-checked after every wake, so an eviction
+        # racing this read can't strand us on a stale signal
+        while True:
+            with self._mutex:
+                if self._cache_contains(key):
+                    break
+                event = self._chunk_ready.setdefault(
+                    key, threading.Event()
+                )
+            event.wait()
+        self._load_timestep(frame)
+        with self._mutex:
+            self._consumer_pos += 1
+            self._progress.notify_all()
 
     def run(self):
-        while self._frame_seq and not self._stop_event:
-            frame = self._frame_seq.pop(0)
-            key = frame % self._frames_per_chunk
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        # chunk key -> Future for in-flight reads
+        pending = {}
+        try:
+            while not self._stop_event.is_set():
+                with self._mutex:
+                    if self._consumer_pos >= len(self._frame_seq):
+                        break
+                    for key in [
+                        k
+                        for k, f in pending.items()
+                        if f is not None and f.done()
+                    ]:
+                        del pending[key]
+                    submit = []
+                    for key, first_need in self._upcoming_keys(pending):
+                        if not self._make_room(pending, first_need):
+                            break
+                        # reserve the in-flight slot before releasing
+                        # the mutex; replaced with the Future below
+                        pending[key] = None
+                        submit.append(key)
+                    if not submit:
+                        # everything upcoming is cached or in flight,
+                        # or the cache is full of sooner-needed chunks;
+                        # wait for the consumer to advance or a fetch
+                        # to finish
+                        self._progress.wait(timeout=0.1)
+                        continue
+                for key in submit:
+                    event = self._chunk_event(key)
+                    future = executor.submit(self._get_key, key)
+                    future.add_done_callback(
+                        lambda _f, _e=event: self._fetch_finished(_e)
+                    )
+                    pending[key] = future
+        finally:
+            executor.shutdown(wait=False)
+
+    def _fetch_finished(self, event):
+        with self._mutex:
+            event.set()
+            self._progress.notify_all()
 
-            if self._cache_contains(key):
+    def _chunk_event(self, key):
+        """Return the readiness Event for a chunk, creating it if this
+        is the first reference"""
+        with self._mutex:
+            return self._chunk_ready.setdefault(key, threading.Event())
+
+    def _upcoming_keys(self, pending):
+        """Next chunk keys the consumer will need that are neither
+        cached nor in flight, paired with the sequence position of
+        their first use, at most one per executor worker.
+
+        Scanning from the consumer's position rather than a separate
+        producer cursor means an evicted chunk that is still needed
+        shows up again as a candidate. Must be called with the mutex
+        held.
+        """
+        keys = []
+        seen = set()
+        for pos in range(self._consumer_pos, len(self._frame_seq)):
+            key = int(self._frame_seq[pos]) // self._frames_per_chunk
+            if key in seen:
                 continue
-            elif self._num_cache_frames < self._max_cache_frames:
-                self._get_key(key)
-            else:
-                with self._mutex:
-                    eviction_key = self._predict()
-                    self._evict(eviction_key)
-                    self._get_key(key)
-                    self._frame_available.notify()
+            seen.add(key)
+            if key in pending or self._cache_contains(key):
+                continue
+            keys.append((key, pos))
+            if len(keys) == self._max_workers:
+                break
+        return keys
+
+    def _make_room(self, pending, first_need):
+        """Evict until there is room for one more chunk, counting
+        in-flight fetches against the budget. Never evicts a chunk the
+        consumer needs at or before ``first_need``, the sequence
+        position at which the incoming chunk is first used, so a chunk
+        the consumer is waiting on (or will block on sooner than the
+        incoming one) stays resident. Returns False if no room can be
+        made safely. Must be called with the mutex held.
+        """
+        in_flight = (len(pending) + 1) * self._frames_per_chunk
+        while self._num_cache_frames + in_flight > self._max_cache_frames:
+            victims = [
+                key for key in self._cached_keys() if key not in pending
+            ]
+            if not victims:
+                return False
+            victim = self._predict(victims)
+            if self._next_use(int(victim)) <= first_need:
+                return False
+            self._evict(victim)
+            event = self._chunk_ready.get(victim)
+            if event is not None:
+                # clear rather than pop so a consumer holding this
+                # Event waits for the refetch instead of a dict entry
+                # that no longer exists
+                event.clear()
+        return True
 
     def _stop(self):
         self._stop_event.set()
@@ -90,41 +254,39 @@ class AsyncFrameCache(FrameCache, threading.Thread):
     def cleanup(self):
         self._stop()
 
-    def _predict(frame_seq, cache, frame_seq_len, index):
-        """
-        1. Attempt to find a page that is
-           never referenced in the future
-        2. If not possible, return the page that is referenced
-           furthest in the future
+    def _next_use(self, key):
+        """Position in the frame sequence at which the chunk is next
+        consumed, measured from the consumer's cursor, or a sentinel
+        if it is never referenced again"""
+        positions = self._chunk_to_positions.get(key)
+        if positions is None:
+            return np.iinfo(np.int64).max
+        j = np.searchsorted(positions, self._consumer_pos)
+        if j < len(positions):
+            return int(positions[j])
+        return np.iinfo(np.int64).max
 
-        Cache is a list of available chunks
+    def _predict(self, cache):
+        """Belady's eviction policy: return the cached chunk key whose
+        next consumption is furthest in the future, preferring chunks
+        that are never referenced again.
 
-        returns the key of the chunk to be replaced
-        chunks have keys based on frame number % chunksize
+        ``cache`` is the sequence of chunk keys currently held.
         """
-        res = -1
-        farthest = index
-        for i in range(len(cache)):
-            j = 0
-            for j in range(index, frame_seq_len):
-                if cache[i] == frame_seq[j]:
-                    if j > farthest:
-                        farthest = j
-                        res = i
-                    break
-            # If a page is never referenced in future, return it.
-            if j == frame_seq_len:
-                return i
-        # If all of the frames were not in future, return any of them, we return 0. Otherwise we return res.
-        return 0 if (res == -1) else res
+        cache = np.asarray(cache)
+        next_use = np.empty(len(cache), dtype=np.int64)
+        for i, key in enumerate(cache):
+            next_use[i] = self._next_use(int(key))
+        return cache[int(np.argmax(next_use))]
 
     @abc.abstractmethod
-    def _stop(self):
-        pass
+    def _cache_contains(self, key):
+        """Returns whether the chunk with the given key is
+        present in the cache"""
 
     @abc.abstractmethod
-    def _cache_contains(self, frame):
-        pass
+    def _cached_keys(self):
+        """Returns the chunk keys currently present in the cache"""
 
     @abc.abstractmethod
     def _get_key(self, key):
@@ -1,6 +1,10 @@
 import zarrtraj
+from zarrtraj.cache import AsyncFrameCache
 import zarr
 import os
+import threading
+import time
+from collections import deque
 import boto3
 import s3fs
 import MDAnalysis as mda
@@ -86,9 +90,13 @@ class H5MDFmtReference(BaseReference):
 
     def iter_ts(self, i):
         ts = self.first_frame.copy()
-        ts.positions = 2**i * self.first_frame.positions
-        ts.velocities = ts.positions / 10
-        ts.forces = ts.positions / 100
+        # scale in float32 directly into the copied timestep's buffers
+        # rather than allocating fresh intermediate arrays
+        np.multiply(
+            self.first_frame.positions, np.float32(2.0**i), out=ts.positions
+        )
+        np.multiply(ts.positions, np.float32(0.1), out=ts.velocities)
+        np.multiply(ts.positions, np.float32(0.01), out=ts.forces)
         ts.time = i
         ts.frame = i
         return ts
@@ -424,6 +432,96 @@ class TestH5MDFmtWriterBaseAPI(BaseWriterTest):
                     ref.writer("foo")
 
 
+class ArrayFrameCache(AsyncFrameCache):
+    """Minimal concrete AsyncFrameCache serving chunks of an in-memory
+    array, used to exercise the prefetch machinery"""
+
+    def __init__(
+        self, data, timestep, frames_per_chunk, max_cache_frames=None, **kwargs
+    ):
+        super().__init__(None, 0, timestep, frames_per_chunk, **kwargs)
+        self._data = data
+        self._chunks = {}
+        if max_cache_frames is None:
+            max_cache_frames = len(data)
+        self._max_cache_frames = max_cache_frames
+        self.loaded = []
+
+    @property
+    def _num_cache_frames(self):
+        return len(self._chunks) * self._frames_per_chunk
+
+    def update_desired_dsets(self):
+        pass
+
+    def _cache_contains(self, key):
+        return key in self._chunks
+
+    def _cached_keys(self):
+        return list(self._chunks)
+
+    def _get_key(self, key):
+        start = key * self._frames_per_chunk
+        self._chunks[key] = self._data[
+            start : start + self._frames_per_chunk
+        ]
+
+    def _evict(self, key):
+        del self._chunks[key]
+
+    def _load_timestep(self, frame):
+        chunk = self._chunks[frame // self._frames_per_chunk]
+        self.loaded.append(chunk[frame % self._frames_per_chunk])
+
+
+def test_async_frame_cache_prefetch():
+    data = np.arange(20, dtype=np.float64)
+    cache = ArrayFrameCache(data, None, 4)
+    frames = list(range(20))
+    cache.update_frame_seq(deque(frames))
+    cache._reader_q.extend(frames)
+    for _ in frames:
+        cache.load_frame()
+    cache.cleanup()
+    assert_equal(np.asarray(cache.loaded), data)
+
+
+def test_async_frame_cache_small_budget():
+    # cache budget smaller than the sequence's chunk span, with a
+    # consumer slower than the fetches; regression test for eviction
+    # outrunning the consumer and leaving load_frame blocked forever
+    data = np.arange(16, dtype=np.float64)
+    cache = ArrayFrameCache(data, None, 1, max_cache_frames=2)
+    frames = list(range(16))
+    cache.update_frame_seq(deque(frames))
+    cache._reader_q.extend(frames)
+
+    def consume():
+        for _ in frames:
+            cache.load_frame()
+            time.sleep(0.005)
+
+    consumer = threading.Thread(target=consume, daemon=True)
+    consumer.start()
+    consumer.join(timeout=30)
+    assert not consumer.is_alive()
+    cache.cleanup()
+    assert_equal(np.asarray(cache.loaded), data)
+
+
+def test_async_frame_cache_belady_eviction():
+    data = np.arange(40, dtype=np.float64)
+    cache = ArrayFrameCache(data, None, 4)
+    cache.update_frame_seq(deque(range(20)))
+    for key in range(4):
+        cache._get_key(key)
+    # chunk 3 is referenced furthest in the future
+    assert cache._predict(cache._cached_keys()) == 3
+    cache._get_key(9)
+    # chunk 9 is never referenced again
+    assert cache._predict(cache._cached_keys()) == 9
+
+
 class TestH5MDFmtWriterNumcodecs:
     @pytest.fixture()
     def universe(self):
@@ -1,5 +1,8 @@
 import re
+import os
+import mmap
 import pathlib
+from collections import OrderedDict
 import fsspec
 from dataclasses import dataclass
 import zarr
@@ -132,6 +135,21 @@ class H5MDElement:
         return self._value.attrs.get("unit", None)
 
 
+class MemoryMappedDirectoryStore(zarr.DirectoryStore):
+    """DirectoryStore that memory-maps chunk files instead of reading
+    them into fresh buffers, so uncompressed chunk reads copy bytes
+    straight out of the OS page cache.
+    """
+
+    def _fromfile(self, fn):
+        with open(fn, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                return b""
+            return memoryview(
+                mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+
+
 def get_protocol(url: str) -> str:
     parts = re.split(r"(\:\:|\://)", url, maxsplit=1)
     if len(parts) > 1:
@@ -143,15 +161,71 @@ def get_extension(url: str) -> str:
     return pathlib.Path(url).suffix
 
 
+# Translated kerchunk references for recently opened HDF5 files, so
+# parse_n_atoms and the reader's __init__ don't both pay for scanning
+# the file (several round-trips on object stores)
+_h5_reference_cache = OrderedDict()
+_H5_REFERENCE_CACHE_SIZE = 8
+
+
+def _file_fingerprint(url: str, so: dict):
+    """Cheap identity for the file behind ``url`` (size plus mtime or
+    ETag, depending on the filesystem), so cached references are never
+    served for a file that was rewritten at the same path. Returns
+    ``None`` if the filesystem cannot report it.
+    """
+    try:
+        fs, path = fsspec.core.url_to_fs(url, **so)
+        info = fs.info(path)
+    except Exception:
+        return None
+    return (
+        info.get("size"),
+        info.get("mtime") or info.get("ETag") or info.get("LastModified"),
+    )
+
+
+def _translate_h5_references(url: str, so: dict) -> dict:
+    try:
+        cache_key = (url, tuple(sorted(so.items())))
+        hash(cache_key)
+    except TypeError:
+        # storage options contain unhashable values; skip caching
+        cache_key = None
+
+    fingerprint = None
+    if cache_key is not None:
+        fingerprint = _file_fingerprint(url, so)
+        if fingerprint is None:
+            # can't tell whether the file changed; don't risk serving
+            # stale references
+            cache_key = None
+
+    if cache_key is not None:
+        cached = _h5_reference_cache.get(cache_key)
+        if cached is not None and cached[0] == fingerprint:
+            _h5_reference_cache.move_to_end(cache_key)
+            return cached[1]
+
+    with fsspec.open(url, **so) as inf:
+        h5chunks = SingleHdf5ToZarr(inf, url, inline_threshold=100)
+        fo = h5chunks.translate(preserve_linked_dsets=True)
+
+    if cache_key is not None:
+        _h5_reference_cache[cache_key] = (fingerprint, fo)
+        _h5_reference_cache.move_to_end(cache_key)
+        while len(_h5_reference_cache) > _H5_REFERENCE_CACHE_SIZE:
+            _h5_reference_cache.popitem(last=False)
+    return fo
+
+
 def get_h5_zarr_mapping(
     url: str,
     protocol: str,
     so: dict,
 ) -> str:
 
-    with fsspec.open(url, **so) as inf:
-        h5chunks = SingleHdf5ToZarr(inf, url, inline_threshold=100)
-        fo = h5chunks.translate(preserve_linked_dsets=True)
+    fo = _translate_h5_references(url, so)
 
     if protocol in ZARRTRAJ_NETWORK_PROTOCOLS:
         fs = fsspec.filesystem(
@@ -175,8 +249,13 @@ def get_h5_zarr_mapping(
 
 def get_mapping_for(filename, protocol, ext, so):
     if ext == ".zarr" or ext == ".zarrmd":
-        fs = fsspec.filesystem(protocol, **so)
-        mapping = fs.get_mapper(filename)
+        if protocol == "file":
+            # filename may carry an explicit file:// scheme
+            path = fsspec.core.split_protocol(filename)[1]
+            mapping = MemoryMappedDirectoryStore(path)
+        else:
+            fs = fsspec.filesystem(protocol, **so)
+            mapping = fs.get_mapper(filename)
     elif ext == ".h5md" or ext == ".h5":
         mapping = get_h5_zarr_mapping(filename, protocol, so)
     else: